@@ -1,30 +1,124 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
-import speech_recognition as sr
-import textstat
-import openai
-from pydub import AudioSegment
+from sqlalchemy import event
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.engine import Engine
+import atexit
+import io
+import json
 import os
+import queue
 import re
-from langdetect import detect
-from deep_translator import GoogleTranslator
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import datetime
+import functools
+
+try:
+    import hyperscan
+except ImportError:  # no wheel for this platform; fall back to FILLER_RE
+    hyperscan = None
 
 # Flask setup
 app = Flask(__name__)
 CORS(app)
 
-# Database setup (SQLite)
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///speechfluency.db'
+# Database setup (SQLite by default; set DATABASE_URL for PostgreSQL)
+DB_URL = os.getenv("DATABASE_URL", "sqlite:///speechfluency.db")
+if DB_URL.startswith("postgres://"):  # Render/Heroku style URL, rejected by SQLAlchemy
+    DB_URL = DB_URL.replace("postgres://", "postgresql://", 1)
+app.config['SQLALCHEMY_DATABASE_URI'] = DB_URL
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+if not app.config['SQLALCHEMY_DATABASE_URI'].startswith("sqlite"):
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'pool_size': 20, 'max_overflow': 40, 'pool_pre_ping': True}
 db = SQLAlchemy(app)
 
-# OpenAI setup
-openai.api_key = os.getenv("OPENAI_API_KEY")
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets readers run alongside the background writer; NORMAL skips the fsync per commit
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+# Results are queued and written in batches by a background thread
+DB_BATCH_SIZE = 100
+DB_FLUSH_INTERVAL = 0.2  # seconds
+DB_SHUTDOWN_TIMEOUT = 10  # seconds to wait for an in-flight batch at exit
+DB_QUEUE_SIZE = 10000  # rows held in memory while the database is unreachable
+DB_RETRY_DELAY = 1  # seconds; doubles up to DB_RETRY_MAX_DELAY while the database is down
+DB_RETRY_MAX_DELAY = 60
+_STOP_WRITER = object()
+_writer_stop = threading.Event()
+_write_queue = queue.Queue(maxsize=DB_QUEUE_SIZE)
+_writer_lock = threading.Lock()
+_writer_thread = None
+
+# OpenAI setup (one pooled HTTP/2 client per process, built on first use)
+_openai_client = None
+_openai_client_lock = threading.Lock()
+
+# Fixed instructions go in the system message so every request shares the same prompt prefix
+GRAMMAR_SYSTEM_PROMPT = "Correct the grammar in the user's sentence and give friendly suggestions to improve spoken English."
+MENTOR_SYSTEM_PROMPT = "You are a friendly spoken English coach. Reply to the user's message."
+
+# Whisper setup (local int8 inference, loaded on first use; WHISPER_WORKERS transcriptions may run at once).
+# Transcription is CPU-bound, so by default each gunicorn worker gets its share of the cores, split
+# between its concurrent transcriptions (WHISPER_CPU_THREADS compute threads each).
+# Containers may report the host's cores here; set these explicitly when that is the case.
+AVAILABLE_CPUS = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", 2))
+WHISPER_WORKERS = int(os.getenv("WHISPER_WORKERS", max(1, AVAILABLE_CPUS // WEB_CONCURRENCY)))
+WHISPER_CPU_THREADS = int(os.getenv(
+    "WHISPER_CPU_THREADS", max(1, AVAILABLE_CPUS // (WEB_CONCURRENCY * WHISPER_WORKERS))))
+_whisper_model = None
+_whisper_model_lock = threading.Lock()
+whisper_slots = threading.Semaphore(WHISPER_WORKERS)
+
+# Replies cached per normalized prompt, so repeated transcripts/messages skip the API call
+GPT_CACHE_SIZE = int(os.getenv("GPT_CACHE_SIZE", 1024))
+_gpt_cache = OrderedDict()
+_gpt_cache_lock = threading.Lock()
+
+# Background threads for OpenAI calls so they overlap with local analysis
+GPT_WORKERS = int(os.getenv("GPT_WORKERS", 8))
+gpt_executor = ThreadPoolExecutor(max_workers=GPT_WORKERS, thread_name_prefix="gpt")
 
 # Filler words list
 FILLERS = ["um", "uh", "like", "you know", "so", "actually", "basically"]
+FILLER_RE = re.compile(r'\b(?:' + '|'.join(re.escape(f) for f in FILLERS) + r')\b', re.IGNORECASE)
+
+# Syllables are estimated per word as vowel groups, minus a silent ending, with at least one per word.
+# Silent: final "e" ("make", but not consonant + "le" as in "table"), "-es" unless after a sibilant
+# ("times" but not "places"), and "-ed" unless after t/d ("liked" but not "wanted").
+# WORD_RE is also the word count used for wpm and Flesch, so both ratios share one tokenization.
+WORD_RE = re.compile(r"[^\W_]+(?:['\u2019][^\W_]+)*")
+VOWEL_GROUP_RE = re.compile(r'[aeiouy]+')
+SILENT_ENDING_RE = re.compile(
+    r'[aeiouy][b-df-hj-np-tv-xz]*(?:'
+    r'(?<![b-df-hj-np-tv-xz]l)(?<=[b-df-hj-np-tv-xz])e'
+    r'|(?<![b-df-hj-np-tv-xz]l)(?<![cs]h)(?<=[bdfhj-np-rtvw])es'
+    r'|(?<=[b-df-hj-np-tv-xz])(?<![td])ed'
+    r')$'
+)
+
+# Hyperscan database with one pattern per filler (id = index into FILLERS).
+# UTF8|UCP gives Unicode \w like Python's re; \b is not allowed in UCP mode, so the
+# word boundaries are spelled out as non-word characters or the ends of the text.
+if hyperscan is not None:
+    filler_db = hyperscan.Database()
+    filler_db.compile(
+        expressions=[(r'(?:^|\W)' + re.escape(f) + r'(?:\W|$)').encode() for f in FILLERS],
+        ids=list(range(len(FILLERS))),
+        elements=len(FILLERS),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP] * len(FILLERS),
+    )
+    _scratch = threading.local()  # scratch space cannot be shared between threads
 
 # ------------ Database Model -------------
 class SpeechResult(db.Model):
@@ -38,66 +132,335 @@ class SpeechResult(db.Model):
     language = db.Column(db.String(10), nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.datetime.utcnow)
 
+# ------------ Background DB Writer -------------
+RESULT_COLUMNS = ["transcript", "grammar_feedback", "fluency_score", "word_count",
+                  "wpm", "fillers", "language", "created_at"]
+
+def _copy_value(value):
+    # COPY text format: \N is NULL; backslash, tab and newlines must be escaped
+    if value is None:
+        return "\\N"
+    return (str(value).replace("\\", "\\\\").replace("\t", "\\t")
+            .replace("\n", "\\n").replace("\r", "\\r"))
+
+def _copy_results(batch):
+    # PostgreSQL: stream the whole batch through one COPY instead of per-row ORM inserts
+    buffer = io.StringIO()
+    for result in batch:
+        if result.created_at is None:
+            result.created_at = datetime.datetime.utcnow()
+        buffer.write("\t".join(_copy_value(getattr(result, c)) for c in RESULT_COLUMNS) + "\n")
+    buffer.seek(0)
+
+    conn = db.engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.copy_expert(
+            f"COPY {SpeechResult.__table__.name} ({', '.join(RESULT_COLUMNS)}) FROM STDIN",
+            buffer,
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+def _write_batch(batch):
+    # copy_expert is psycopg2-only; other PostgreSQL drivers use the ORM bulk insert
+    if db.engine.dialect.name == "postgresql" and db.engine.driver == "psycopg2":
+        _copy_results(batch)
+    else:
+        db.session.bulk_save_objects(batch)
+        db.session.commit()
+
+def _row_errors():
+    # Errors caused by the rows themselves; COPY raises the driver's own exception classes
+    dbapi = db.engine.dialect.dbapi
+    return IntegrityError, DataError, dbapi.IntegrityError, dbapi.DataError
+
+def _flush_results(batch):
+    delay = DB_RETRY_DELAY
+    with app.app_context():
+        while True:
+            try:
+                _write_batch(batch)
+                return
+            except _row_errors():
+                db.session.rollback()
+                app.logger.warning("Batch of %d speech results rejected; retrying row by row", len(batch))
+                break
+            except Exception:
+                # Connection-level failure: back off and retry the whole batch, logging once per outage
+                db.session.rollback()
+                if _writer_stop.is_set():
+                    app.logger.exception("Database unavailable at shutdown; dropping %d speech results", len(batch))
+                    return
+                if delay == DB_RETRY_DELAY:
+                    app.logger.exception("Database unavailable; retrying %d speech results with backoff", len(batch))
+                _writer_stop.wait(delay)
+                delay = min(delay * 2, DB_RETRY_MAX_DELAY)
+
+        # Retry individually so only the rows the database rejects are lost
+        for i, result in enumerate(batch):
+            try:
+                _write_batch([result])
+            except _row_errors():
+                db.session.rollback()
+                app.logger.exception("Failed to save speech result: %.80r", result.transcript)
+            except Exception:
+                db.session.rollback()
+                _flush_results(batch[i:])  # connection lost mid-retry; back off with the rest
+                return
+
+def _db_writer():
+    while True:
+        item = _write_queue.get()
+        if item is _STOP_WRITER:
+            return
+        batch = [item]
+        stopping = False
+        deadline = time.monotonic() + DB_FLUSH_INTERVAL
+        while len(batch) < DB_BATCH_SIZE:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = _write_queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is _STOP_WRITER:
+                stopping = True
+                break
+            batch.append(item)
+        _flush_results(batch)
+        if stopping:
+            return
+
+def save_result(result):
+    global _writer_thread
+    # Started lazily so each forked worker gets its own writer
+    with _writer_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(target=_db_writer, name="db-writer", daemon=True)
+            _writer_thread.start()
+    try:
+        _write_queue.put_nowait(result)
+    except queue.Full:
+        app.logger.error("Write queue full; dropping speech result: %.80r", result.transcript)
+
+@atexit.register
+def _drain_write_queue():
+    # Let the writer finish the batch it already took off the queue, then write what is left
+    _writer_stop.set()  # cut any backoff short
+    if _writer_thread is not None and _writer_thread.is_alive():
+        try:
+            _write_queue.put(_STOP_WRITER, timeout=DB_SHUTDOWN_TIMEOUT)
+        except queue.Full:
+            pass
+        _writer_thread.join(timeout=DB_SHUTDOWN_TIMEOUT)
+
+    batch = []
+    while True:
+        try:
+            item = _write_queue.get_nowait()
+        except queue.Empty:
+            break
+        if item is not _STOP_WRITER:
+            batch.append(item)
+    if batch:
+        _flush_results(batch)
+
 # ------------ Helper Functions -------------
-def get_gpt_feedback(text):
-    prompt = f"Correct the grammar in this sentence and give friendly suggestions to improve spoken English:\n\n{text}"
-    response = openai.ChatCompletion.create(
+# Heavy libraries are imported where first needed to keep worker start-up fast
+def get_whisper_model():
+    global _whisper_model
+    if _whisper_model is None:
+        with _whisper_model_lock:
+            if _whisper_model is None:
+                from faster_whisper import WhisperModel
+                _whisper_model = WhisperModel(
+                    os.getenv("WHISPER_MODEL", "base"),
+                    device=os.getenv("WHISPER_DEVICE", "auto"),
+                    compute_type=os.getenv("WHISPER_COMPUTE_TYPE", "int8"),
+                    cpu_threads=WHISPER_CPU_THREADS,
+                    num_workers=WHISPER_WORKERS,
+                )
+    return _whisper_model
+
+def transcribe_english(audio_file):
+    # Always transcribe as English (this is an English coach): an accent Whisper misdetects must not
+    # switch the transcript to another language. The spoken language is detected separately for the
+    # "language" field. PyAV decodes the upload once, whatever the container.
+    from faster_whisper import decode_audio
+    audio = decode_audio(audio_file.stream)
+    model = get_whisper_model()
+    language = model.detect_language(audio)[0] if model.model.is_multilingual else "en"
+    segments, _ = model.transcribe(audio, language="en", vad_filter=True, beam_size=1)
+    return segments, language
+
+def get_openai_client():
+    global _openai_client
+    if _openai_client is None:
+        with _openai_client_lock:
+            if _openai_client is None:
+                import httpx
+                import openai
+                _openai_client = openai.OpenAI(
+                    api_key=os.getenv("OPENAI_API_KEY"),
+                    http_client=httpx.Client(
+                        http2=True,
+                        timeout=30.0,
+                        limits=httpx.Limits(max_keepalive_connections=50),
+                    ),
+                )
+    return _openai_client
+
+def _reset_openai_client():
+    # A forked worker must not share the parent's sockets
+    global _openai_client
+    _openai_client = None
+
+os.register_at_fork(after_in_child=_reset_openai_client)
+
+def _gpt_cache_key(kind, text):
+    # Key on lowercased, whitespace-collapsed text so trivial variations hit the same entry
+    return kind, " ".join(text.lower().split())
+
+def _gpt_cache_get(key):
+    with _gpt_cache_lock:
+        if key in _gpt_cache:
+            _gpt_cache.move_to_end(key)
+            return _gpt_cache[key]
+    return None
+
+def _gpt_cache_put(key, reply):
+    with _gpt_cache_lock:
+        _gpt_cache[key] = reply
+        if len(_gpt_cache) > GPT_CACHE_SIZE:
+            _gpt_cache.popitem(last=False)
+
+def cached_gpt_reply(kind, text, fetch):
+    key = _gpt_cache_key(kind, text)
+    reply = _gpt_cache_get(key)
+    if reply is None:
+        reply = fetch(text)
+        _gpt_cache_put(key, reply)
+    return reply
+
+def _feedback_messages(text):
+    return [
+        {"role": "system", "content": GRAMMAR_SYSTEM_PROMPT},
+        {"role": "user", "content": text},
+    ]
+
+def _fetch_gpt_feedback(text):
+    response = get_openai_client().chat.completions.create(
         model="gpt-3.5-turbo",
-        messages=[{"role": "user", "content": prompt}]
+        messages=_feedback_messages(text)
     )
     return response.choices[0].message.content.strip()
 
-def mentor_chat(message):
-    prompt = f"You are a friendly spoken English coach. Reply to: {message}"
-    response = openai.ChatCompletion.create(
+def stream_gpt_feedback(text):
+    # Yields the feedback as it is generated; a cache hit comes back as one chunk
+    key = _gpt_cache_key("feedback", text)
+    cached = _gpt_cache_get(key)
+    if cached is not None:
+        yield cached
+        return
+
+    stream = get_openai_client().chat.completions.create(
         model="gpt-3.5-turbo",
-        messages=[{"role": "user", "content": prompt}]
+        messages=_feedback_messages(text),
+        stream=True
+    )
+    parts = []
+    for chunk in stream:
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if delta:
+            parts.append(delta)
+            yield delta
+    reply = "".join(parts).strip()
+    if reply:
+        _gpt_cache_put(key, reply)
+
+def _fetch_mentor_reply(message):
+    response = get_openai_client().chat.completions.create(
+        model="gpt-3.5-turbo",
+        messages=[
+            {"role": "system", "content": MENTOR_SYSTEM_PROMPT},
+            {"role": "user", "content": message},
+        ]
     )
     return response.choices[0].message.content.strip()
 
-def detect_fillers(text):
-    words = re.findall(r'\b\w+\b', text.lower())
-    return [w for w in FILLERS if w in words]
+def get_gpt_feedback(text):
+    return cached_gpt_reply("feedback", text, _fetch_gpt_feedback)
 
-# ------------ API Routes -------------
+def mentor_chat(message):
+    return cached_gpt_reply("chat", message, _fetch_mentor_reply)
 
-@app.route("/analyze", methods=["POST"])
-def analyze():
-    audio_file = request.files.get('audio') or request.files.get('file')
-    if not audio_file:
-        return jsonify({"error": "No audio uploaded"}), 400
+@functools.lru_cache(maxsize=4096)
+def _word_syllables(word):
+    count = len(VOWEL_GROUP_RE.findall(word))
+    if SILENT_ENDING_RE.search(word):
+        count -= 1
+    return max(count, 1)
 
-    # Convert to WAV
-    audio = AudioSegment.from_file(audio_file)
-    audio_path = "temp.wav"
-    audio.export(audio_path, format="wav")
+def count_syllables(words):
+    # Digits, "hmm", "mr" etc. have no vowel group but are still spoken as (at least) one syllable
+    return sum(_word_syllables(w) for w in words)
 
-    recognizer = sr.Recognizer()
-    with sr.AudioFile(audio_path) as source:
-        audio_data = recognizer.record(source)
-        try:
-            transcript = recognizer.recognize_google(audio_data)
-        except sr.UnknownValueError:
-            os.remove(audio_path)
-            return jsonify({"error": "Speech not recognized"}), 400
+def compute_text_stats(text):
+    # Count words, sentences and syllables once; wpm and readability both derive from these
+    import textstat  # only needed once a transcript is scored
+
+    words = WORD_RE.findall(text.lower())
+    return {
+        "words": len(words),
+        "sentences": max(textstat.sentence_count(text), 1),
+        "syllables": count_syllables(words),
+    }
+
+def flesch_reading_ease(stats):
+    if not stats["words"]:
+        return 0.0
+    score = (206.835
+             - 1.015 * (stats["words"] / stats["sentences"])
+             - 84.6 * (stats["syllables"] / stats["words"]))
+    return round(score, 2)
 
-    os.remove(audio_path)
+def _on_filler_match(filler_id, start, end, flags, found):
+    found.add(filler_id)
 
-    # Duration in seconds (passed from client)
+def detect_fillers(text):
+    if hyperscan is not None:
+        scratch = getattr(_scratch, "scratch", None)
+        if scratch is None:
+            scratch = _scratch.scratch = hyperscan.Scratch(filler_db)
+        found_ids = set()
+        filler_db.scan(text.encode(), match_event_handler=_on_filler_match, context=found_ids, scratch=scratch)
+        return [f for i, f in enumerate(FILLERS) if i in found_ids]
+
+    # One pass over the text; also matches multi-word fillers like "you know"
+    found = {m.group(0).lower() for m in FILLER_RE.finditer(text)}
+    return [f for f in FILLERS if f in found]
+
+def parse_duration():
+    # Duration in seconds (passed from client); returns (duration, error response)
     try:
         duration = float(request.form.get("duration", 0))
         if duration == 0:
-            return jsonify({"error": "Invalid or zero duration"}), 400
+            return None, (jsonify({"error": "Invalid or zero duration"}), 400)
     except ValueError:
-        return jsonify({"error": "Invalid duration"}), 400
+        return None, (jsonify({"error": "Invalid duration"}), 400)
+    return duration, None
 
+def build_result(transcript, lang, duration, stats, detected_fillers, grammar_feedback):
     duration_minutes = duration / 60
-    word_count = len(transcript.split())
+    word_count = stats["words"]
     wpm = round(word_count / duration_minutes, 2)
-    score = textstat.flesch_reading_ease(transcript)
-    grammar_feedback = get_gpt_feedback(transcript)
-    detected_fillers = detect_fillers(transcript)
-    lang = detect(transcript)
+    score = flesch_reading_ease(stats)
 
     # Save to database
     result = SpeechResult(
@@ -109,10 +472,9 @@ def analyze():
         fillers=",".join(detected_fillers),
         language=lang
     )
-    db.session.add(result)
-    db.session.commit()
+    save_result(result)
 
-    return jsonify({
+    return {
         "transcript": transcript,
         "language": lang,
         "word_count": word_count,
@@ -120,7 +482,92 @@ def analyze():
         "fluency_score": score,
         "fillers": detected_fillers,
         "grammar_feedback": grammar_feedback
-    })
+    }
+
+def sse_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+# ------------ API Routes -------------
+
+@app.route("/analyze", methods=["POST"])
+def analyze():
+    audio_file = request.files.get('audio') or request.files.get('file')
+    if not audio_file:
+        return jsonify({"error": "No audio uploaded"}), 400
+
+    # Validate before transcribing so a bad request doesn't take a Whisper slot
+    duration, error = parse_duration()
+    if error:
+        return error
+
+    with whisper_slots:
+        # segments is a lazy generator, so consume it while holding the slot
+        segments, lang = transcribe_english(audio_file)
+        transcript = " ".join(s.text.strip() for s in segments).strip()
+
+    if not transcript:
+        return jsonify({"error": "Speech not recognized"}), 400
+
+    # Start the OpenAI round trip first and do the local analysis while it is in flight
+    gpt_future = gpt_executor.submit(get_gpt_feedback, transcript)
+
+    stats = compute_text_stats(transcript)
+    detected_fillers = detect_fillers(transcript)
+    grammar_feedback = gpt_future.result()
+
+    return jsonify(build_result(transcript, lang, duration, stats, detected_fillers, grammar_feedback))
+
+@app.route("/analyze/stream", methods=["POST"])
+def analyze_stream():
+    # Same input as /analyze, answered as Server-Sent Events:
+    # "segment" per recognized segment, "feedback" per GPT chunk, then "result" (or "error")
+    audio_file = request.files.get('audio') or request.files.get('file')
+    if not audio_file:
+        return jsonify({"error": "No audio uploaded"}), 400
+
+    duration, error = parse_duration()
+    if error:
+        return error
+
+    def generate():
+        # Always finish with "result" or "error", even if transcription or OpenAI fails mid-stream
+        try:
+            parts = []
+            with whisper_slots:
+                segments, lang = transcribe_english(audio_file)
+                for segment in segments:
+                    text = segment.text.strip()
+                    parts.append(text)
+                    yield sse_event("segment", {"text": text, "start": segment.start, "end": segment.end})
+
+            transcript = " ".join(parts).strip()
+            if not transcript:
+                yield sse_event("error", {"error": "Speech not recognized"})
+                return
+
+            stats = compute_text_stats(transcript)
+            detected_fillers = detect_fillers(transcript)
+
+            feedback_parts = []
+            for chunk in stream_gpt_feedback(transcript):
+                feedback_parts.append(chunk)
+                yield sse_event("feedback", {"text": chunk})
+            grammar_feedback = "".join(feedback_parts).strip()
+
+            result = build_result(
+                transcript, lang, duration, stats, detected_fillers, grammar_feedback
+            )
+            yield sse_event("result", result)
+        except Exception:
+            app.logger.exception("Streaming analysis failed")
+            yield sse_event("error", {"error": "Analysis failed"})
+
+    # stream_with_context keeps the request (and its uploaded file) open until the generator finishes
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @app.route("/chat", methods=["POST"])
 def chat():
@@ -133,6 +580,7 @@ def chat():
 
 
 # ------------ App Runner -------------
+# Local development only; production runs under gunicorn (see gunicorn.conf.py)
 if __name__ == "__main__":
     with app.app_context():
         db.create_all()
@@ -0,0 +1,28 @@
+import os
+
+# Production entrypoint: gunicorn app:app (picks up this file automatically)
+bind = f"0.0.0.0:{os.getenv('PORT', '10000')}"
+
+# Each worker process loads its own Whisper model (a few hundred MB) and runs CPU-bound
+# transcriptions, so worker count is bounded by memory and cores rather than by I/O.
+# Keep it small (WEB_CONCURRENCY, default 2); app.py splits the cores between workers
+# via WHISPER_WORKERS. Threads only add concurrency for requests waiting on OpenAI.
+workers = int(os.getenv("WEB_CONCURRENCY", 2))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", 8))
+keepalive = 30
+
+# The app is imported once in the master and inherited by the forked workers, which is what
+# lets on_starting create the schema exactly once. Trade-off: `kill -HUP` restarts workers
+# but does not reload code; deploys need a full restart (as Render does anyway).
+preload_app = True
+
+
+def on_starting(server):
+    # Create tables once in the master, before workers boot, so they don't race on create_all.
+    # Drop the master's connections so forked workers don't share them.
+    from app import app, db
+
+    with app.app_context():
+        db.create_all()
+        db.engine.dispose()